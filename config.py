@@ -16,47 +16,53 @@ from src.importers import caixabank, n26, paypal, revolut
 # beancount doesn't run from this directory
 sys.path.insert(0, path.join(path.dirname(__file__)))
 
+# The smart_importer wrappers train an sklearn model on the existing
+# ledger every run; disable them to skip that cost when raw extraction
+# is enough (e.g. quick identify passes or first-time imports with no
+# ledger to learn from).
+SMART_IMPORT = True
+
+
+def smart(importer):
+    """Wrap an importer with the smart_importer predictors if enabled."""
+    if not SMART_IMPORT:
+        return importer
+    return PredictPostings().wrap(PredictPayees().wrap(importer))
+
+
 # Setting this variable provides a list of importer instances.
 CONFIG = [
-    PredictPostings().wrap(
-        PredictPayees().wrap(
-            caixabank.CaixabankImporter(
-                {
-                    "main_account": "Assets:EU:CaixaBank:Checking",
-                    "filename_pattern": "^Caixabank-",
-                    "account_number": "0101278127",
-                }
-            )
+    smart(
+        caixabank.CaixabankImporter(
+            {
+                "main_account": "Assets:EU:CaixaBank:Checking",
+                "filename_pattern": "^Caixabank-",
+                "account_number": "0101278127",
+            }
         )
     ),
-    PredictPostings().wrap(
-        PredictPayees().wrap(
-            paypal.PaypalImporter(
-                {
-                    "main_account": "Assets:Online:Paypal:Checking",
-                    "filename_pattern": "^Paypal-",
-                }
-            )
+    smart(
+        paypal.PaypalImporter(
+            {
+                "main_account": "Assets:Online:Paypal:Checking",
+                "filename_pattern": "^Paypal-",
+            }
         )
     ),
-    PredictPostings().wrap(
-        PredictPayees().wrap(
-            revolut.RevolutImporter(
-                {
-                    "main_account": "Assets:EU:Revolut:Checking",
-                    "filename_pattern": "^Revolut-",
-                }
-            )
+    smart(
+        revolut.RevolutImporter(
+            {
+                "main_account": "Assets:EU:Revolut:Checking",
+                "filename_pattern": "^Revolut-",
+            }
         )
     ),
-    PredictPostings().wrap(
-        PredictPayees().wrap(
-            n26.N26Importer(
-                {
-                    "main_account": "Assets:EU:N26:Checking",
-                    "filename_pattern": "^N26-",
-                }
-            )
+    smart(
+        n26.N26Importer(
+            {
+                "main_account": "Assets:EU:N26:Checking",
+                "filename_pattern": "^N26-",
+            }
         )
     ),
 ]
@@ -29,7 +29,7 @@ class CaixabankImporter(BankingImporter):
             config: Configuration dictionary.
         """
         super().__init__(config)
-        self.reader = OFXReader(config)
+        self.reader = self._cached_reader(config, lambda: OFXReader(config))
 
     def get_balance_statement(
         self, file: str | None = None
@@ -5,7 +5,8 @@ into Beancount-compatible transactions and balances using a
 configured CSVReader.
 """
 
-from typing import Any
+from dataclasses import replace
+from typing import Any, ClassVar
 
 from ...readers.csv_reader import CSVReader, CSVReaderOptions
 from ...transactions.banking import BalanceStatement, BankingImporter
@@ -24,6 +25,35 @@ class N26Importer(BankingImporter):
     IMPORTER_NAME: str = "N26"
     reader: CSVReader
 
+    # Parsing options are identical for every instance, so they are built
+    # once at import time; only the transformation callback is bound per
+    # instance via dataclasses.replace in __init__.
+    _CSV_OPTIONS: ClassVar[CSVReaderOptions] = CSVReaderOptions(
+        max_rounding_error=0.04,
+        header_identifier="",
+        column_labels_line=(
+            '"Booking Date","Value Date","Partner Name","Partner Iban",'
+            'Type,"Payment Reference","Account Name","Amount (EUR)",'
+            '"Original Amount","Original Currency","Exchange Rate"'
+        ),
+        date_format="%Y-%m-%d",
+        skip_comments="# ",
+        header_map={
+            "Booking Date": "date",
+            # "Currency": "currency",  # Not used here
+            "Type": "type",
+            "Payment Reference": "payee",
+            "Amount (EUR)": "amounts",
+        },
+        skip_transaction_types=[],
+        transaction_type_map={
+            "Credit Transfer": "payment",
+            "Instant Savings": "payment",
+            "Debig Transfer": "payment",
+        },
+        transformation_cb=None,
+    )
+
     def __init__(self, config: dict[str, Any]) -> None:
         """Initialize the N26 importer with configuration.
 
@@ -32,38 +62,18 @@ class N26Importer(BankingImporter):
         """
         super().__init__(config)
 
-        csv_options = CSVReaderOptions(
-            max_rounding_error=0.04,
-            header_identifier="",
-            column_labels_line=(
-                '"Booking Date","Value Date","Partner Name","Partner Iban",'
-                'Type,"Payment Reference","Account Name","Amount (EUR)",'
-                '"Original Amount","Original Currency","Exchange Rate"'
-            ),
-            date_format="%Y-%m-%d",
-            skip_comments="# ",
-            header_map={
-                "Booking Date": "date",
-                # "Currency": "currency",  # Not used here
-                "Type": "type",
-                "Payment Reference": "payee",
-                "Amount (EUR)": "amounts",
-            },
-            skip_transaction_types=[],
-            transaction_type_map={
-                "Credit Transfer": "payment",
-                "Instant Savings": "payment",
-                "Debig Transfer": "payment",
-            },
-            transformation_cb=self.transformations,
+        csv_options = replace(
+            self._CSV_OPTIONS, transformation_cb=self.transformations
+        )
+        self.reader = self._cached_reader(
+            config, lambda: CSVReader(config, csv_options)
         )
-
-        self.reader = CSVReader(config, csv_options)
 
     def transformations(self, rdr: Any) -> Any:
         """Apply transformations to the raw CSV data.
 
-        Adds fields: currency, amount, and memo to each row.
+        Adds fields: currency, amount, and memo to each row, in a single
+        pipeline stage so rows are dispatched once.
 
         Args:
             rdr: PETL table of parsed CSV rows.
@@ -71,12 +81,13 @@ class N26Importer(BankingImporter):
         Returns:
             Transformed PETL table.
         """
-        rdr = rdr.addfield("currency", "EUR")
-        rdr = rdr.addfield(
-            "amount", lambda x: f"{float(x['Amount (EUR)']):.2f}"
+        return rdr.addfields(
+            [
+                ("currency", "EUR"),
+                ("amount", lambda x: f"{float(x['Amount (EUR)']):.2f}"),
+                ("memo", lambda x: ""),
+            ]
         )
-        rdr = rdr.addfield("memo", lambda x: "")
-        return rdr
 
     def get_balance_statement(
         self, file: str | None = None
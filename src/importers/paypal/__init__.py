@@ -5,7 +5,8 @@ CSVReader with transformation rules and header mappings.
 """
 
 from collections.abc import Iterator
-from typing import Any
+from dataclasses import replace
+from typing import Any, ClassVar
 
 from ...readers.csv_reader import CSVReader, CSVReaderOptions
 from ...transactions.banking import BalanceStatement, BankingImporter
@@ -24,6 +25,39 @@ class PaypalImporter(BankingImporter):
     IMPORTER_NAME: str = "Paypal"
     reader: CSVReader
 
+    # Parsing options are identical for every instance, so they are built
+    # once at import time; only the transformation callback is bound per
+    # instance via dataclasses.replace in __init__.
+    _CSV_OPTIONS: ClassVar[CSVReaderOptions] = CSVReaderOptions(
+        max_rounding_error=0.04,
+        header_identifier="",
+        column_labels_line=(
+            '"Date","Time","Time Zone","Description","Currency",'
+            '"Gross ","Fee ","Net","Balance","Transaction ID",'
+            '"From Email Address","Name","Bank Name","Bank Account",'
+            '"Shipping and Handling Amount","Sales Tax","Invoice ID",'
+            '"Reference Txn ID"'
+        ),
+        date_format="%d/%m/%Y",
+        skip_comments="# ",
+        header_map={
+            "Date": "date",
+            "From Email Address": "checknum",
+            "Currency": "currency",
+            "Description": "type",
+        },
+        skip_transaction_types=[
+            "General Authorization - Pending",
+            "General Authorization - Completed",
+        ],
+        transaction_type_map={
+            "Website Payment": "payment",
+            "PreApproved Payment Bill User Payment": "payment",
+            "Express Checkout Payment": "payment",
+        },
+        transformation_cb=None,
+    )
+
     def __init__(self, config: dict[str, Any]) -> None:
         """Initialize the Paypal importer with configuration.
 
@@ -32,42 +66,19 @@ class PaypalImporter(BankingImporter):
         """
         super().__init__(config)
 
-        csv_options = CSVReaderOptions(
-            max_rounding_error=0.04,
-            header_identifier="",
-            column_labels_line=(
-                '"Date","Time","Time Zone","Description","Currency",'
-                '"Gross ","Fee ","Net","Balance","Transaction ID",'
-                '"From Email Address","Name","Bank Name","Bank Account",'
-                '"Shipping and Handling Amount","Sales Tax","Invoice ID",'
-                '"Reference Txn ID"'
-            ),
-            date_format="%d/%m/%Y",
-            skip_comments="# ",
-            header_map={
-                "Date": "date",
-                "From Email Address": "checknum",
-                "Currency": "currency",
-                "Description": "type",
-            },
-            skip_transaction_types=[
-                "General Authorization - Pending",
-                "General Authorization - Completed",
-            ],
-            transaction_type_map={
-                "Website Payment": "payment",
-                "PreApproved Payment Bill User Payment": "payment",
-                "Express Checkout Payment": "payment",
-            },
-            transformation_cb=self.transformations,
+        csv_options = replace(
+            self._CSV_OPTIONS, transformation_cb=self.transformations
+        )
+        self.reader = self._cached_reader(
+            config, lambda: CSVReader(config, csv_options)
         )
-
-        self.reader = CSVReader(config, csv_options)
 
     def transformations(self, rdr: Any) -> Any:
         """Apply transformations to raw CSV data.
 
-        Adds computed fields: amount, balance, payee, and memo.
+        Adds computed fields: amount, balance, payee, and memo. All four
+        fields are added in a single pipeline stage so each row is
+        dispatched once instead of through four chained `addfield` nodes.
 
         Args:
             rdr: PETL table representing the parsed CSV rows.
@@ -75,20 +86,14 @@ class PaypalImporter(BankingImporter):
         Returns:
             Transformed PETL table object.
         """
-        rdr = rdr.addfield(
-            "amount",
-            lambda x: x["Net"].replace(",", "."),
-        )
-        rdr = rdr.addfield(
-            "balance",
-            lambda x: x["Balance"].replace(",", "."),
-        )
-        rdr = rdr.addfield(
-            "payee",
-            lambda x: f"{x['Description']}: {x['Name']}",
+        return rdr.addfields(
+            [
+                ("amount", lambda x: x["Net"].replace(",", ".")),
+                ("balance", lambda x: x["Balance"].replace(",", ".")),
+                ("payee", lambda x: f"{x['Description']}: {x['Name']}"),
+                ("memo", lambda x: ""),
+            ]
         )
-        rdr = rdr.addfield("memo", lambda x: "")
-        return rdr
 
     def get_balance_statement(
         self, file: str | None = None
@@ -105,5 +110,7 @@ class PaypalImporter(BankingImporter):
         """
         date = self.reader.get_balance_assertion_date()
         if date:
-            first = self.reader.rdr.namedtuples()[0]
+            # Pull only the first row; indexing the petl view re-runs
+            # the whole converter pipeline to count rows.
+            first = next(iter(self.reader.rdr.namedtuples()))
             yield BalanceStatement(date, first.balance, first.currency)
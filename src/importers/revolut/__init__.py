@@ -6,7 +6,10 @@ Beancount-compatible transactions and balance statements.
 """
 
 from collections.abc import Iterator
-from typing import Any
+from dataclasses import replace
+from typing import Any, ClassVar
+
+from beancount.core.number import D
 
 from ...readers.csv_reader import CSVReader, CSVReaderOptions
 from ...transactions.banking import BalanceStatement, BankingImporter
@@ -25,6 +28,34 @@ class RevolutImporter(BankingImporter):
     IMPORTER_NAME: str = "Revolut"
     reader: CSVReader
 
+    # Parsing options are identical for every instance, so they are built
+    # once at import time; only the transformation callback is bound per
+    # instance via dataclasses.replace in __init__.
+    _CSV_OPTIONS: ClassVar[CSVReaderOptions] = CSVReaderOptions(
+        max_rounding_error=0.04,
+        header_identifier="",
+        column_labels_line=(
+            "Type,Product,Started Date,Completed Date,"
+            "Description,Amount,Fee,Currency,State,Balance"
+        ),
+        date_format="%Y-%m-%d %H:%M:%S",
+        skip_comments="# ",
+        header_map={
+            "Started Date": "date",
+            "Currency": "currency",
+            "Type": "type",
+            "Description": "payee",
+            "Balance": "balance",
+        },
+        skip_transaction_types=[],
+        transaction_type_map={
+            "TOPUP": "payment",
+            "CARD_PAYMENT": "payment",
+            "TRANSFER": "payment",
+        },
+        transformation_cb=None,
+    )
+
     def __init__(self, config: dict[str, Any]) -> None:
         """Initialize the Revolut importer with configuration.
 
@@ -33,37 +64,18 @@ class RevolutImporter(BankingImporter):
         """
         super().__init__(config)
 
-        csv_options = CSVReaderOptions(
-            max_rounding_error=0.04,
-            header_identifier="",
-            column_labels_line=(
-                "Type,Product,Started Date,Completed Date,"
-                "Description,Amount,Fee,Currency,State,Balance"
-            ),
-            date_format="%Y-%m-%d %H:%M:%S",
-            skip_comments="# ",
-            header_map={
-                "Started Date": "date",
-                "Currency": "currency",
-                "Type": "type",
-                "Description": "payee",
-                "Balance": "balance",
-            },
-            skip_transaction_types=[],
-            transaction_type_map={
-                "TOPUP": "payment",
-                "CARD_PAYMENT": "payment",
-                "TRANSFER": "payment",
-            },
-            transformation_cb=self.transformations,
+        csv_options = replace(
+            self._CSV_OPTIONS, transformation_cb=self.transformations
+        )
+        self.reader = self._cached_reader(
+            config, lambda: CSVReader(config, csv_options)
         )
-
-        self.reader = CSVReader(config, csv_options)
 
     def transformations(self, rdr: Any) -> Any:
         """Apply transformations to raw CSV data.
 
-        Adds computed 'amount' and empty 'memo' fields to each row.
+        Adds computed 'amount' and empty 'memo' fields to each row, in a
+        single pipeline stage so rows are dispatched once.
 
         Args:
             rdr: Raw PETL table object.
@@ -71,12 +83,15 @@ class RevolutImporter(BankingImporter):
         Returns:
             Transformed PETL table object.
         """
-        rdr = rdr.addfield(
-            "amount",
-            lambda x: f"{float(x['Amount']) - float(x['Fee']):.2f}",
+        # The difference is computed directly in Decimal: one exact parse
+        # per operand, no float round-trip, and no string reformatting for
+        # the downstream amount conversion to undo.
+        return rdr.addfields(
+            [
+                ("amount", lambda x: D(x["Amount"]) - D(x["Fee"])),
+                ("memo", lambda x: ""),
+            ]
         )
-        rdr = rdr.addfield("memo", lambda x: "")
-        return rdr
 
     def get_balance_statement(
         self, file: str | None = None
@@ -93,5 +108,7 @@ class RevolutImporter(BankingImporter):
         """
         date = self.reader.get_balance_assertion_date()
         if date:
-            first = self.reader.rdr.namedtuples()[0]
+            # Pull only the first row; indexing the petl view re-runs
+            # the whole converter pipeline to count rows.
+            first = next(iter(self.reader.rdr.namedtuples()))
             yield BalanceStatement(date, first.balance, first.currency)
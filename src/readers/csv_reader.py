@@ -15,24 +15,103 @@ Typical usage example:
 """
 
 import datetime
+import logging
 import re
-import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable, Iterator
 
 import petl as etl
 from beancount.core.data import Transaction
-from beancount.core.number import D
+from beancount.core.number import D, Decimal
 from beangulp import cache
 
+from ..util.errors import CustomException
 from .reader import Reader
 
+_log = logging.getLogger(__name__)
 
-@dataclass
+# Compiled once: strips currency symbols and separators from amount
+# strings, leaving only digits, the decimal point, and the sign.
+_NON_NUMERIC_RE = re.compile(r"[^0-9\.-]")
+
+# Translation table mapping the characters that are invalid in column
+# names to underscores; str.translate is a single C-level pass.
+_COLUMN_NAME_TBL = str.maketrans("-/ ", "___")
+
+
+def _remove_non_numeric(x: str) -> str:
+    """Strip every character that cannot be part of a decimal number.
+
+    Args:
+        x: Raw cell value, possibly with currency symbols or separators.
+
+    Returns:
+        A cleaned string suitable for Decimal construction.
+    """
+    return _NON_NUMERIC_RE.sub("", str(x).strip())
+
+
+def _make_date_parser(
+    date_format: str,
+) -> Callable[[str], datetime.datetime]:
+    """Build a specialized parser for a known date format.
+
+    strptime re-parses the format string and walks the locale machinery
+    on every call; for the fixed formats used by the importers a direct
+    slice-and-int parse is several times cheaper. Unknown formats fall
+    back to strptime.
+
+    Args:
+        date_format: The strptime-style format to specialize.
+
+    Returns:
+        A callable converting a raw cell value to a datetime.
+    """
+    if date_format == "%Y-%m-%d":
+
+        def parse(d: str) -> datetime.datetime:
+            d = d.strip()
+            return datetime.datetime(int(d[0:4]), int(d[5:7]), int(d[8:10]))
+
+    elif date_format == "%d/%m/%Y":
+
+        def parse(d: str) -> datetime.datetime:
+            d = d.strip()
+            return datetime.datetime(int(d[6:10]), int(d[3:5]), int(d[0:2]))
+
+    elif date_format == "%Y-%m-%d %H:%M:%S":
+
+        def parse(d: str) -> datetime.datetime:
+            d = d.strip()
+            return datetime.datetime(
+                int(d[0:4]),
+                int(d[5:7]),
+                int(d[8:10]),
+                int(d[11:13]),
+                int(d[14:16]),
+                int(d[17:19]),
+            )
+
+    else:
+        strptime = datetime.datetime.strptime
+
+        def parse(d: str) -> datetime.datetime:
+            return strptime(d.strip(), date_format)
+
+    return parse
+
+
+@dataclass(frozen=True, slots=True)
 class CSVReaderOptions:
     """Configuration options for CSVReader.
 
+    Frozen with slots: instances are shared at class level by the
+    importers and must not be mutated in place (per-instance variants
+    are derived with dataclasses.replace), and slots avoid a per-options
+    __dict__ while making attribute reads in the hot conversion paths a
+    fixed-offset load.
+
     Attributes:
         max_rounding_error: Allowed rounding error when processing amounts.
         header_identifier: Regex string to identify the header row in the CSV.
@@ -53,7 +132,7 @@ class CSVReaderOptions:
     header_map: dict[str, str]
     skip_transaction_types: list[str]
     transaction_type_map: dict[str, str]
-    transformation_cb: Callable[[Any], Any]
+    transformation_cb: Callable[[Any], Any] | None
 
 
 class CSVReader(Reader):
@@ -77,6 +156,18 @@ class CSVReader(Reader):
         """
         super().__init__(config)
         self.options = opt
+        # Frozen once: skip_transaction is called per row.
+        self._skip_types = frozenset(opt.skip_transaction_types)
+        # Specialize the header check once: None when any header matches,
+        # a plain startswith for literal patterns, a compiled regex
+        # otherwise. identify() probes every discovered file with this.
+        ident = opt.header_identifier
+        if not ident:
+            self._match_head = None
+        elif re.escape(ident) == ident:
+            self._match_head = lambda head: head.startswith(ident)
+        else:
+            self._match_head = re.compile(ident).match
 
     def try_parse(self, file: str) -> bool:
         """Check if the file matches the configured header pattern.
@@ -87,15 +178,20 @@ class CSVReader(Reader):
         Returns:
             True if the file header matches the identifier pattern, False otherwise.
         """
-        if re.match(
-            self.options.header_identifier,
+        if self._match_head is None:
+            # No identifier configured: accept without touching the file.
+            return True
+        if self._match_head(
             cache.get_file(file).head(
                 encoding=getattr(self, "file_encoding", None)
-            ),
+            )
         ):
             return True
-        print("header_identifier failed---------------:")
-        print(self.options.header_identifier, cache.get_file(file).head())
+        _log.debug(
+            "header_identifier %r did not match the head of %s",
+            self.options.header_identifier,
+            file,
+        )
         return False
 
     def date(self, file: str) -> datetime.date:
@@ -107,7 +203,6 @@ class CSVReader(Reader):
         Returns:
             The most recent transaction date in the file.
         """
-        self.initialize(file)
         self.read_file(file)
         return max(ot.date for ot in self.get_transactions()).date()
 
@@ -131,27 +226,53 @@ class CSVReader(Reader):
         Returns:
             PETL table with updated column names.
         """
-        header_map = {k: re.sub(r"[-/ ]", "_", k) for k in rdr.header()}
-        return rdr.rename(header_map)
+        header_map = {
+            k: fixed
+            for k in rdr.header()
+            if (fixed := k.translate(_COLUMN_NAME_TBL)) != k
+        }
+        # No offending characters: skip the rename node entirely rather
+        # than adding an identity stage to the pipeline.
+        return rdr.rename(header_map) if header_map else rdr
 
     def _convert_columns(self, rdr: Any) -> Any:
         """Convert known columns to appropriate data types.
 
+        The header is computed once and all conversions are gathered into
+        a single dict-form `convert` call, so the row stream is dispatched
+        through one petl stage instead of one chained node per column.
+
         Args:
             rdr: PETL table.
 
         Returns:
             PETL table with converted columns.
         """
-        if "type" in rdr.header():
-            rdr = rdr.convert("type", self.options.transaction_type_map)
+        header = frozenset(rdr.header())
+        conversions: dict[str, Any] = {}
+
+        if "type" in header:
+            # Same semantics as handing petl the mapping directly (values
+            # missing from the map pass through unchanged), but a single
+            # bound dict.get per row instead of petl's contains-then-index
+            # pair of lookups.
+            type_map_get = self.options.transaction_type_map.get
+
+            def convert_type(v: str) -> str:
+                return type_map_get(v, v)
+
+            conversions["type"] = convert_type
 
         for col in ["units"]:
-            if col in rdr.header():
-                rdr = rdr.convert(col, D)
+            if col in header:
+                conversions[col] = D
 
-        def remove_non_numeric(x: str) -> str:
-            return re.sub(r"[^0-9\.-]", "", str(x).strip())
+        def convert_amount(x: str | Decimal) -> Decimal:
+            # Transformations may emit ready-made Decimals; don't stringify
+            # and reparse them.
+            if isinstance(x, Decimal):
+                return x
+            return D(_remove_non_numeric(x))
 
         for col in getattr(self, "currency_fields", []) + [
             "unit_price",
@@ -160,24 +281,20 @@ class CSVReader(Reader):
             "amount",
             "balance",
         ]:
-            if col in rdr.header():
-                rdr = rdr.convert(col, remove_non_numeric)
-                rdr = rdr.convert(col, D)
+            if col in header:
+                conversions[col] = convert_amount
 
-        def convert_date(d: str) -> datetime.datetime:
-            return datetime.datetime.strptime(
-                d.strip(), self.options.date_format
-            )
+        convert_date = _make_date_parser(self.options.date_format)
 
         for col in getattr(self, "date_fields", []) + [
             "date",
             "tradeDate",
             "settleDate",
         ]:
-            if col in rdr.header():
-                rdr = rdr.convert(col, convert_date)
+            if col in header:
+                conversions[col] = convert_date
 
-        return rdr
+        return rdr.convert(conversions) if conversions else rdr
 
     def _read_raw(self, file: str) -> Any:
         """Read a raw CSV file into a PETL table.
@@ -213,15 +330,18 @@ class CSVReader(Reader):
         if not col_labels:
             return rdr
 
-        skip = None
+        # Stop at the first matching row instead of scanning the whole
+        # file; the header appears once in these exports. Hashing the
+        # labels once turns the per-row check into a set containment
+        # test instead of a nested linear scan per label.
+        label_set = frozenset(col_labels)
         for n, r in enumerate(rdr):
-            if all(i in list(r) for i in col_labels):
-                skip = n
-        if skip is None:
-            print("Error: expected columns not found:")
-            print(col_labels)
-            sys.exit(1)
-        return rdr.skip(skip)
+            if label_set.issubset(r):
+                return rdr.skip(n)
+        raise CustomException(
+            "Expected columns not found in CSV file",
+            details=str(col_labels),
+        )
 
     def _extract_table_with_header(
         self, rdr: Any, col_labels: list[str] | None = None
@@ -236,33 +356,46 @@ class CSVReader(Reader):
             PETL table with only the relevant data rows.
         """
         rdr = self._skip_until_main_table(rdr, col_labels)
-        nrows = len(rdr)
         for n, r in enumerate(rdr):
             if not r or all(i == "" for i in r):
-                nrows = n - 1
-                break
-        return rdr.head(nrows)
+                return rdr.head(n - 1)
+        # No trailing blank row: the table runs to the end of the file,
+        # so avoid the len(rdr) full scan a default head() would need.
+        return rdr
 
     def read_file(self, file: str) -> None:
         """Read and fully process the CSV file.
 
+        The processed table is cached per file path, so repeated
+        `identify`/`extract`/`date` passes over the same file do not
+        reparse it.
+
         Args:
             file: Path to the CSV file.
         """
-        if not getattr(self, "file_read_done", False):
+        if getattr(self, "ifile", None) != file:
             rdr = self._read_raw(file)
             rdr = self._prepare_raw_file(rdr)
             rdr = rdr.skip(getattr(self, "skip_head_rows", 0))
-            rdr = rdr.head(len(rdr) - getattr(self, "skip_tail_rows", 0) - 1)
+            skip_tail_rows = getattr(self, "skip_tail_rows", 0)
+            if skip_tail_rows:
+                # len() on a petl view walks the entire table; only pay
+                # for it when there is actually a tail to trim.
+                rdr = rdr.head(len(rdr) - skip_tail_rows - 1)
             rdr = self._extract_table_with_header(rdr)
             if hasattr(self.options, "skip_comments"):
                 rdr = rdr.skipcomments(self.options.skip_comments)
             rdr = rdr.rowslice(getattr(self, "skip_data_rows", 0), None)
             rdr = self.options.transformation_cb(rdr)
-            rdr = rdr.rename(self.options.header_map)
+            if self.options.header_map:
+                rdr = rdr.rename(self.options.header_map)
             rdr = self._convert_columns(rdr)
             rdr = self._fix_column_names(rdr)
-            self.rdr = rdr
+            # Memoize rows as they are first requested: the table is
+            # iterated several times per file (max date, transactions,
+            # balance row) and each pass would otherwise re-read and
+            # re-convert the whole CSV through the lazy pipeline.
+            self.rdr = rdr.cache()
             self.ifile = file
 
     def get_transactions(self) -> Iterator[Transaction]:
@@ -285,10 +418,7 @@ class CSVReader(Reader):
         Returns:
             True if the transaction type is in the skip list, False otherwise.
         """
-        return (
-            getattr(row, "type", "NO_TYPE")
-            in self.options.skip_transaction_types
-        )
+        return getattr(row, "type", "NO_TYPE") in self._skip_types
 
     def get_balance_assertion_date(self) -> datetime.date | None:
         """Get the balance assertion date.
@@ -296,21 +426,41 @@ class CSVReader(Reader):
         Returns:
             One day after the latest transaction date, or None if no date found.
         """
-        if not self.get_max_transaction_date():
+        date = self.get_max_transaction_date()
+        if not date:
             return None
-        return self.get_max_transaction_date() + datetime.timedelta(days=1)
+        return date + datetime.timedelta(days=1)
 
     def get_max_transaction_date(self) -> datetime.date | None:
         """Get the latest transaction date in the processed table.
 
+        The empty cases (no file read yet, no date column, no rows) are
+        checked explicitly rather than swallowed by a blanket exception
+        handler, so a genuine parse failure propagates instead of
+        silently turning into "no date" and triggering re-reads upstream.
+
         Returns:
             The latest transaction date, or None if unavailable.
         """
-        try:
-            date = max(
-                ot.tradeDate if hasattr(ot, "tradeDate") else ot.date
-                for ot in self.get_transactions()
-            ).date()
-        except Exception:
+        rdr = getattr(self, "rdr", None)
+        if rdr is None:
+            return None
+        # Memoized per file: callers ask for this scalar repeatedly.
+        if getattr(self, "_max_date_file", None) == self.ifile:
+            return self._max_date
+        header = rdr.header()
+        col = "tradeDate" if "tradeDate" in header else "date"
+        if col not in header:
+            return None
+        # Reduce over the date column directly: no per-row namedtuple
+        # materialization and no per-row hasattr probing.
+        values = iter(rdr.values(col))
+        best = next(values, None)
+        if best is None:
             return None
-        return date
+        for value in values:
+            if value > best:
+                best = value
+        self._max_date = best.date()
+        self._max_date_file = self.ifile
+        return self._max_date
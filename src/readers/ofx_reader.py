@@ -21,6 +21,10 @@ from .reader import Reader
 
 warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
 
+# Built once at import; defining a namedtuple class is an exec-based
+# code-object build and does not belong inside a per-file method.
+_Balance = namedtuple("Balance", ["date", "amount"])
+
 
 class OFXReader(Reader):
     """Reader for OFX and QFX statement files.
@@ -33,6 +37,7 @@ class OFXReader(Reader):
         ofx (ofxparse.Ofx): Parsed OFX data.
         ofx_account (Any): Account extracted from parsed OFX data.
         currency (str): Currency code (e.g. 'USD') for the account.
+        ifile (str): Path of the last successfully parsed file.
     """
 
     FILE_EXTS: list[str] = ["ofx", "qfx"]
@@ -57,19 +62,30 @@ class OFXReader(Reader):
         Returns:
             True if the file was successfully parsed, False otherwise.
         """
+        # Memoized per file path: beangulp probes the same file through
+        # identify(), date() and extract(), and each probe used to
+        # re-parse the whole statement.
+        if getattr(self, "ifile", None) == file:
+            return self.ofx_account is not None
+
         self.ofx_account = None
         try:
             self.ofx = self.read_file(file)
         except ofxparse.OfxParserException:
             return False
+        self.ifile = file
 
+        acc_num_field = getattr(self, "account_number_field", "account_id")
+        config_account = self.config["account_number"]
         for acc in self.ofx.accounts:
-            acc_num_field = getattr(self, "account_number_field", "account_id")
             if self.match_account_number(
-                getattr(acc, acc_num_field),
-                self.config["account_number"],
+                getattr(acc, acc_num_field), config_account
             ):
                 self.ofx_account = acc
+                break
+
+        if self.ofx_account is None:
+            return False
 
         self.currency = self.ofx_account.statement.currency.upper()
         return True
@@ -107,12 +123,28 @@ class OFXReader(Reader):
     def read_file(self, file: str) -> Any:
         """Read and parse an OFX/QFX file.
 
+        The file is handed to ofxparse directly first; the BeautifulSoup
+        cleanup pass (which builds a full DOM, strips empty SGML tags,
+        and re-serializes the document) is only run as a fallback for
+        exports that ofxparse cannot digest as-is.
+
         Args:
             file: Path to the OFX/QFX file.
 
         Returns:
             Parsed OFX object.
         """
+        if getattr(self, "ifile", None) == file:
+            return self.ofx
+
+        with open(file, "rb") as fh:
+            try:
+                ofx = ofxparse.OfxParser.parse(fh)
+            except (ofxparse.OfxParserException, ValueError):
+                ofx = None
+        if ofx is not None and ofx.accounts:
+            return ofx
+
         with open(file, "r", encoding="utf-8") as fh:
             sgml_content = fh.read()
 
@@ -144,12 +176,11 @@ class OFXReader(Reader):
             Generator of namedtuples with balance data.
         """
         if not hasattr(self.ofx_account.statement, "balance"):
-            return []
+            return
 
         date = self.get_balance_assertion_date()
         if date:
-            Balance = namedtuple("Balance", ["date", "amount"])
-            yield Balance(date, self.ofx_account.statement.balance)
+            yield _Balance(date, self.ofx_account.statement.balance)
 
     def get_balance_positions(self) -> Generator[Any, None, None]:
         """Yield current investment positions if present.
@@ -158,7 +189,7 @@ class OFXReader(Reader):
             Generator of position entries.
         """
         if not hasattr(self.ofx_account.statement, "positions"):
-            return []
+            return
         yield from self.ofx_account.statement.positions
 
     def get_available_cash(
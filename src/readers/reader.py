@@ -4,20 +4,37 @@ Defines the abstract `Reader` class which serves as a base for implementing
 file readers that extract transactions and balances from various formats.
 """
 
-import inspect
+import os
 import re
-from abc import ABC, abstractmethod
+import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, ClassVar
 
 from beancount.core.data import Transaction
 
 
-class Reader(ABC):
+@lru_cache(maxsize=128)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a filename pattern, sharing the result across readers.
+
+    Args:
+        pattern: Regex source string from the reader configuration.
+
+    Returns:
+        The compiled pattern; identical strings share one object.
+    """
+    return re.compile(pattern)
+
+
+class Reader:
     """Abstract base class for reader implementations.
 
     Subclasses should implement file-specific logic to extract transactions
-    and account information from bank or brokerage statements.
+    and account information from bank or brokerage statements. The required
+    methods below raise NotImplementedError when not overridden; the class
+    deliberately avoids ABCMeta so instantiation stays a plain object
+    construction without the __abstractmethods__ check.
 
     Attributes:
         FILE_EXTS (list[str]): Supported file extensions (without dot).
@@ -30,9 +47,25 @@ class Reader(ABC):
     FILE_EXTS: ClassVar[list[str]] = [""]
     IMPORTER_NAME: ClassVar[str] = "UNKNOWN"
 
+    # Derived once per subclass from FILE_EXTS (see __init_subclass__);
+    # identify() tests file suffixes against this. A tuple rather than a
+    # set: str.endswith sweeps all candidates in one C call, which beats
+    # splitting the extension off first for the 1-2 entries readers have.
+    _EXT_TUP: ClassVar[tuple[str, ...]] = (".",)
+
     config: dict[str, Any]
     currency: str
     filename_pattern: str
+    _filename_re: re.Pattern
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Freeze the lowercased extension set once per subclass.
+
+        Args:
+            **kwargs: Forwarded to the next __init_subclass__ in the MRO.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._EXT_TUP = tuple(f".{e.lower()}" for e in cls.FILE_EXTS)
 
     def __init__(self, config: dict[str, Any]) -> None:
         """Initialize the reader with a config dictionary.
@@ -42,14 +75,21 @@ class Reader(ABC):
                     currency, filename patterns, and accounts.
         """
         self.config = config
-        self.currency = config.get("currency", "CURRENCY_NOT_CONFIGURED")
-        self.filename_pattern = config.get("filename_pattern", "^*")
+        # Interned: the currency string ends up in every Amount tuple, so
+        # sharing one object keeps memory flat and equality checks cheap.
+        self.currency = sys.intern(
+            config.get("currency", "CURRENCY_NOT_CONFIGURED")
+        )
+        self.filename_pattern = config.get("filename_pattern", "")
+        # Compiled once per distinct pattern string; identify() is called
+        # for every file that beangulp discovers, and readers built from
+        # similar configs frequently share the same pattern.
+        self._filename_re = _compile_pattern(self.filename_pattern)
 
     # ────────────────────────────────
     # Required methods.
     # ────────────────────────────────
 
-    @abstractmethod
     def get_transactions(self) -> list[Transaction]:
         """Return the list of parsed transactions.
 
@@ -61,7 +101,6 @@ class Reader(ABC):
         """
         raise NotImplementedError
 
-    @abstractmethod
     def date(self, file: str | Path) -> Any:
         """Return the date associated with the file.
 
@@ -76,7 +115,6 @@ class Reader(ABC):
         """
         raise NotImplementedError
 
-    @abstractmethod
     def read_file(self, file: str | Path) -> None:
         """Read and parse the file contents.
 
@@ -88,7 +126,6 @@ class Reader(ABC):
         """
         raise NotImplementedError
 
-    @abstractmethod
     def try_parse(self, file: str | Path) -> None:
         """Try to parse the file and return the result.
 
@@ -113,14 +150,15 @@ class Reader(ABC):
         Returns:
             True if the reader can handle the file, False otherwise.
         """
-        file_path = Path(file)
+        # Plain string splitting: constructing a Path object per probed
+        # file just to read its name and suffix parses and normalizes
+        # the whole path, which dominates bulk identify() sweeps.
+        name = os.path.basename(os.fspath(file))
 
-        if file_path.suffix.lower() not in (
-            f".{ext.lower()}" for ext in self.FILE_EXTS
-        ):
+        if not name.lower().endswith(self._EXT_TUP):
             return False
 
-        if not re.match(self.filename_pattern, file_path.name):
+        if not self._filename_re.match(name):
             return False
 
         if not self.try_parse(file):
@@ -137,7 +175,7 @@ class Reader(ABC):
         Returns:
             The name of the file (without parent directories).
         """
-        return Path(file).name
+        return os.path.basename(os.fspath(file))
 
     def account(self, file: str | Path) -> str:
         """Return the appropriate account for the given file.
@@ -1,17 +1,24 @@
 """Generic banking importer for beancount."""
 
-import itertools
+import sys
 from abc import ABC, abstractmethod
-from typing import NamedTuple
+from operator import attrgetter
+from collections.abc import Callable, Hashable, Iterator
+from pathlib import Path
+from typing import Any, ClassVar, NamedTuple
 
 from beancount.core import flags
 from beancount.core.amount import Amount
-from beancount.core.data import Balance, Transaction, new_metadata
+from beancount.core.data import EMPTY_SET, Balance, Transaction, new_metadata
 from beangulp import Importer as BaseImporter
 
 from .common import create_posting
 from .transaction_builder import TransactionBuilder
 
+# Fetches the two fields every transaction row carries in a single
+# C-level fan-out instead of two attribute lookups per row.
+_get_date_amount = attrgetter("date", "amount")
+
 
 class BalanceStatement(NamedTuple):
     """Balance Statement representation.
@@ -38,6 +45,9 @@ class BankingImporter(BaseImporter, TransactionBuilder):
         config: Dictionary containing custom settings of the importer.
     """
 
+    # Shared reader instances, keyed by importer class and config items.
+    _reader_cache: ClassVar[dict] = {}
+
     def __init__(self, config: dict) -> None:
         """Initialize the banking importer with a specific set of options.
 
@@ -56,6 +66,36 @@ class BankingImporter(BaseImporter, TransactionBuilder):
         #     'main_account'     : 'destination of import',
         # }
 
+    @classmethod
+    def _cached_reader(
+        cls, config: dict, factory: Callable[[], Any]
+    ) -> Any:
+        """Return a shared reader for this importer class and config.
+
+        Beangulp may instantiate importers several times during a run;
+        readers built from identical configuration are interchangeable, so
+        reuse one instance instead of repeating the parser setup.
+
+        Args:
+            config: Configuration dictionary for the reader.
+            factory: Zero-argument callable that builds a new reader.
+
+        Returns:
+            A reader instance shared across importers with the same config.
+        """
+        key = (
+            cls,
+            frozenset(
+                (k, v)
+                for k, v in config.items()
+                if isinstance(v, Hashable)
+            ),
+        )
+        reader = cls._reader_cache.get(key)
+        if reader is None:
+            reader = cls._reader_cache[key] = factory()
+        return reader
+
     # ────────────────────────────────
     # Required methods.
     # ────────────────────────────────
@@ -104,19 +144,76 @@ class BankingImporter(BaseImporter, TransactionBuilder):
         Returns
             Number of new entries.
         """
-        counter = itertools.count()
+        # Empty files cannot contain transactions; skip the reader setup
+        # and parsing cost entirely before opening anything.
+        if not Path(file).stat().st_size:
+            return []
+
+        # Plain integer line counter: cheaper than an itertools.count
+        # generator crossed per transaction, and its final value hands
+        # off naturally to the balance pass.
+        lineno = 0
         new_entries = []
 
         self.reader.read_file(file)
+
+        # Bind loop-invariant lookups once; every name below is otherwise
+        # resolved through an attribute or dict lookup per transaction.
+        # The account is interned so all postings share one string object.
+        main_account = sys.intern(self.config["main_account"])
+        target_acct = self.config.get("target_account")
+        flag_okay = flags.FLAG_OKAY
+        build_metadata = self.build_metadata
+        get_narration = self.get_narration
+        get_payee = self.get_payee
+        # Hooks left at their TransactionBuilder defaults are dropped
+        # from the loop entirely (flags computed in __init_subclass__)
+        # instead of paying a no-op Python call per transaction.
+        skip_transaction = (
+            None if self._skip_transaction_is_noop else self.skip_transaction
+        )
+        get_tags = None if self._get_tags_is_noop else self.get_tags
+        get_links = None if self._get_links_is_noop else self.get_links
+        add_custom_postings = (
+            None
+            if self._add_custom_postings_is_noop
+            else self.add_custom_postings
+        )
+        get_date_amount = _get_date_amount
+        make_metadata = new_metadata
+        make_transaction = Transaction
+        add_posting = create_posting
+        append_entry = new_entries.append
+
+        # All rows from one reader share a shape, so whether the optional
+        # foreign-amount and currency fields exist is decided once on the
+        # first row instead of probing per transaction (hasattr twice for
+        # the foreign pair, a raised AttributeError for the currency).
+        get_foreign: Callable[[Any], tuple[Any, Any]] | None = None
+        get_currency: Callable[[Any], str] = self._get_currency
+
         for ot in self.reader.get_transactions():
-            if self.skip_transaction(ot):
+            if skip_transaction is not None and skip_transaction(ot):
                 continue
-            metadata = new_metadata(file, next(counter))
+            if get_foreign is None:
+                if hasattr(ot, "foreign_amount"):
+                    get_foreign = lambda ot: (
+                        ot.foreign_amount,
+                        ot.foreign_currency,
+                    )
+                else:
+                    get_foreign = lambda ot: (None, None)
+                if hasattr(ot, "currency"):
+                    get_currency = lambda ot: ot.currency
+                else:
+                    reader_currency = self.reader.currency
+                    get_currency = lambda ot: reader_currency
+            txn_date, amount = get_date_amount(ot)
+            metadata = make_metadata(file, lineno)
+            lineno += 1
             # metadata['type'] = ot.type # Optional metadata, debugging #TODO
             metadata.update(
-                self.build_metadata(
-                    file, metatype="transaction", data={"transaction": ot}
-                )
+                build_metadata(file, metatype="transaction", transaction=ot)
             )
 
             # With Beancount the grammar is (payee, narration). payee is always
@@ -125,42 +222,37 @@ class BankingImporter(BaseImporter, TransactionBuilder):
             # the order unchanged in the call below.
 
             # Build transaction entry
-            entry = Transaction(
+            entry = make_transaction(
                 meta=metadata,
-                date=ot.date.date(),
-                flag=flags.FLAG_OKAY,
+                date=txn_date.date(),
+                flag=flag_okay,
                 # payee and narration are switched. See the preceding note
-                payee=self.get_narration(ot),
-                narration=self.get_payee(ot),
-                tags=self.get_tags(ot),
-                links=self.get_links(ot),
+                payee=get_narration(ot),
+                narration=get_payee(ot),
+                tags=get_tags(ot) if get_tags is not None else EMPTY_SET,
+                links=get_links(ot) if get_links is not None else EMPTY_SET,
                 postings=[],
             )
 
-            main_account = self.config["main_account"]
-
-            create_posting(
+            foreign_amount, foreign_currency = get_foreign(ot)
+            add_posting(
                 entry,
                 main_account,
-                ot.amount,
-                self._get_currency(ot),
-                amount_number=ot.foreign_amount
-                if hasattr(ot, "foreign_amount")
-                else None,
-                amount_currency=ot.foreign_currency
-                if hasattr(ot, "foreign_currency")
-                else None,
+                amount,
+                get_currency(ot),
+                amount_number=foreign_amount,
+                amount_currency=foreign_currency,
             )
 
             # smart_importer can fill this in if the importer doesn't override
-            target_acct = self.config.get("target_account")
             if target_acct:
-                create_posting(entry, target_acct, None, None)
+                add_posting(entry, target_acct, None, None)
 
-            self.add_custom_postings(entry, ot)
-            new_entries.append(entry)
+            if add_custom_postings is not None:
+                add_custom_postings(entry, ot)
+            append_entry(entry)
 
-        new_entries += self._extract_balance(file, counter)
+        new_entries.extend(self._extract_balance(file, lineno))
 
         return new_entries
 
@@ -189,22 +281,24 @@ class BankingImporter(BaseImporter, TransactionBuilder):
     # Private API — do not override.
     # ────────────────────────────────
 
-    def _extract_balance(self, file: str, counter: int) -> list[Transaction]:
-        """Extract the Balance from the file.
+    def _extract_balance(self, file: str, lineno: int) -> Iterator[Balance]:
+        """Yield the Balance entries from the file.
+
+        Entries are generated lazily and appended straight onto the
+        caller's list, avoiding an intermediate list per file.
 
         Args:
             file: Path to the transactions file in use.
-            counter: Integer
-        Returns:
-            List of entries containing balance.
+            lineno: Next free metadata line number.
+        Yields:
+            Entries containing balance.
         """
-        entries = []
-
         for bal in self.get_balance_statement(file=file):
             if bal:
-                metadata = new_metadata(file, next(counter))
+                metadata = new_metadata(file, lineno)
+                lineno += 1
                 metadata.update(self.build_metadata(file, metatype="balance"))
-                balance_entry = Balance(
+                yield Balance(
                     metadata,
                     bal.date,
                     self.config["main_account"],
@@ -212,8 +306,6 @@ class BankingImporter(BaseImporter, TransactionBuilder):
                     None,
                     None,
                 )
-                entries.append(balance_entry)
-        return entries
 
     def _get_currency(self, ot: Transaction) -> str:
         """Return the currency used in the given Transaction.
@@ -1,5 +1,7 @@
 """Common utilities to handle Beancount data such as Transactions."""
 
+import sys
+
 from beancount.core.amount import Amount
 from beancount.core.data import Posting
 from beancount.core.number import D, Decimal
@@ -34,12 +36,35 @@ def create_posting(
       An instance of Posting, and as a side-effect the entry has had its list
       of postings modified with the new Posting instance.
     """
-    units = Amount(D(number), currency)
-    amount = Amount(D(amount_number), amount_currency)
+    # The same handful of account names and currency codes recur on
+    # every posting of an import; interning collapses the duplicates to
+    # one object each, so downstream comparisons are pointer checks.
+    account = sys.intern(account)
+    if currency is not None:
+        currency = sys.intern(currency)
+    if amount_currency is not None:
+        amount_currency = sys.intern(amount_currency)
+
+    # Values arriving from the CSV conversion pipeline are already
+    # Decimal; don't round-trip them through D's parsing again.
+    num = number if isinstance(number, Decimal) else D(number)
+    units = Amount(num, currency)
 
-    # Determine whether to set cost or price if needed.
+    # Determine whether to set cost or price if needed. The intermediate
+    # Amount is only built when a cost is actually requested; the common
+    # banking path creates two postings per transaction, so the wasted
+    # allocation would be paid on every row.
     cost = (
-        Cost(amount.number, amount.currency, None, None) if is_cost else None
+        Cost(
+            amount_number
+            if isinstance(amount_number, Decimal)
+            else D(amount_number),
+            amount_currency,
+            None,
+            None,
+        )
+        if is_cost
+        else None
     )
     price = units if is_price else None
 
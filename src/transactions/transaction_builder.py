@@ -6,12 +6,82 @@ and paycheck sources. Subclasses can override its methods to define custom
 behavior for tagging, linking, skipping, and transforming transactions.
 """
 
+import re
 from abc import ABC
+from functools import lru_cache
+from string import Formatter
+from types import MappingProxyType
 from typing import Any
 
 from beancount.core import data
 from beancount.core.data import EMPTY_SET, Meta, Transaction
 
+# Matches any '{name}' placeholder; used to blank the unresolved ones
+# when deriving filing_account from main_account.
+_PLACEHOLDER_RE = re.compile(r"\{[^}]*\}")
+
+# Shared read-only result for the no-metadata case; callers only feed
+# it to dict.update, so one instance serves every entry.
+_EMPTY_META: Meta = MappingProxyType({})
+
+
+@lru_cache(maxsize=4)
+def _filing_meta(acct: str) -> Meta:
+    """Return the shared filing-account metadata mapping for an account.
+
+    build_metadata emits the same single-key mapping for every entry of
+    an import; caching it avoids one dict allocation per entry.
+
+    Args:
+        acct: The filing account to embed.
+
+    Returns:
+        A read-only single-key mapping.
+    """
+    return MappingProxyType({"filing_account": acct})
+
+@lru_cache(maxsize=512)
+def _parse_template(template: str) -> tuple[tuple[str, str | None], ...]:
+    """Parse a config template into (literal, field) segments, once.
+
+    str.format re-parses the template on every call; config templates
+    are substituted for each importer instance, so the parse result is
+    cached per distinct template string.
+
+    Args:
+        template: A config value with optional '{name}' placeholders.
+
+    Returns:
+        Tuple of (literal text, field name or None) segments.
+    """
+    return tuple(
+        (literal, field)
+        for literal, field, _spec, _conv in Formatter().parse(template)
+    )
+
+
+def _substitute(template: str, substs: dict[str, str]) -> str:
+    """Apply substitutions to a template using its cached parse.
+
+    Args:
+        template: A config value with optional '{name}' placeholders.
+        substs: Mapping of placeholder names to replacement strings.
+
+    Returns:
+        The template with every placeholder replaced.
+    """
+    # Most config values are plain strings; return them untouched
+    # without parsing, allocating, or occupying a cache slot.
+    if "{" not in template:
+        return template
+    parts = []
+    for literal, field in _parse_template(template):
+        if literal:
+            parts.append(literal)
+        if field is not None:
+            parts.append(substs[field])
+    return "".join(parts)
+
 
 class TransactionBuilder(ABC):
     """Base class for building or transforming transactions in custom importers.
@@ -27,6 +97,32 @@ class TransactionBuilder(ABC):
 
     config: dict[str, Any]
 
+    # True while the corresponding hook is the no-op default below;
+    # recomputed per subclass so hot loops can skip the call entirely.
+    _skip_transaction_is_noop: bool = True
+    _get_tags_is_noop: bool = True
+    _get_links_is_noop: bool = True
+    _add_custom_postings_is_noop: bool = True
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Record which per-transaction hooks are left at their defaults.
+
+        Args:
+            **kwargs: Forwarded to the next __init_subclass__ in the MRO.
+        """
+        super().__init_subclass__(**kwargs)
+        for name in (
+            "skip_transaction",
+            "get_tags",
+            "get_links",
+            "add_custom_postings",
+        ):
+            setattr(
+                cls,
+                f"_{name}_is_noop",
+                getattr(cls, name) is getattr(TransactionBuilder, name),
+            )
+
     def skip_transaction(self, ot: Transaction) -> bool:
         """Determine whether a transaction should be skipped.
 
@@ -38,9 +134,12 @@ class TransactionBuilder(ABC):
         """
         return False
 
-    def get_tags(self, ot: Transaction | None = None) -> list[str]:
+    def get_tags(self, ot: Transaction | None = None) -> frozenset[str]:
         """Return a set of tags to attach to a transaction.
 
+        Overrides with small static tag sets should return frozenset
+        literals; the shared EMPTY_SET default allocates nothing.
+
         Args:
             ot: Optional original transaction object.
 
@@ -49,9 +148,12 @@ class TransactionBuilder(ABC):
         """
         return EMPTY_SET
 
-    def get_links(self, ot: Transaction | None = None) -> list[str]:
+    def get_links(self, ot: Transaction | None = None) -> frozenset[str]:
         """Return a set of links to attach to a transaction.
 
+        Overrides with small static link sets should return frozenset
+        literals; the shared EMPTY_SET default allocates nothing.
+
         Args:
             ot: Optional original transaction object.
 
@@ -73,7 +175,12 @@ class TransactionBuilder(ABC):
         Example:
             'Assets:Foo::Bar' -> 'Assets:Foo:Bar'
         """
-        return ":".join(x for x in acct.split(":") if x)
+        # Clean accounts fall straight through the '::' containment
+        # check; collapsing runs a C-level replace per nesting depth,
+        # with no regex machinery or intermediate segment list.
+        while "::" in acct:
+            acct = acct.replace("::", ":")
+        return acct.strip(":")
 
     def set_config_variables(self, substs: dict[str, str]) -> None:
         """Replace placeholders in the config dict using given substitutions.
@@ -89,15 +196,20 @@ class TransactionBuilder(ABC):
                 'source401k': '{source401k}',
             }
         """
-        self.config = {
-            k: v.format(**substs) if isinstance(v, str) else v
-            for k, v in self.config.items()
-        }
-
-        # Derive filing_account if not explicitly defined
+        # Update in place: rewriting values for existing keys is safe
+        # during items() iteration, and rebuilding the whole dict would
+        # rehash every key when most values need no substitution.
+        for k, v in self.config.items():
+            if isinstance(v, str) and "{" in v:
+                self.config[k] = _substitute(v, substs)
+
+        # Derive filing_account if not explicitly defined: strip every
+        # leftover placeholder directly instead of building an all-empty
+        # substitution dict and running the template machinery again.
         if "filing_account" not in self.config:
-            kwargs = {k: "" for k in substs}
-            filing_account = self.config["main_account"].format(**kwargs)
+            filing_account = _PLACEHOLDER_RE.sub(
+                "", self.config["main_account"]
+            )
             self.config["filing_account"] = self.remove_empty_subaccounts(
                 filing_account
             )
@@ -117,7 +229,7 @@ class TransactionBuilder(ABC):
         self,
         file: str,
         metatype: str | None = None,
-        data: dict[str, Any] | None = None,
+        transaction: Transaction | None = None,
     ) -> Meta:
         """Build a metadata dictionary to attach to a directive.
 
@@ -127,17 +239,15 @@ class TransactionBuilder(ABC):
         Args:
             file: The filename being processed.
             metatype: Optional type of directive ('transaction', 'balance').
-            data: Optional dictionary with additional context data.
+            transaction: Optional original transaction for context.
 
         Returns:
             A metadata dictionary to attach to the entry.
         """
-        data = data or {}
-
         if self.config.get("emit_filing_account_metadata", True) is not False:
             acct = self.config.get(
                 "filing_account", self.config.get("main_account", None)
             )
-            return {"filing_account": acct}
+            return _filing_meta(acct)
 
-        return {}
+        return _EMPTY_META
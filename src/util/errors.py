@@ -13,6 +13,10 @@ class CustomException(Exception):
         details: (optional) A string with extra parameters or metadata.
     """
 
+    # code and details live in fixed slots; the instance dict (which
+    # BaseException always carries) stays empty instead of holding them.
+    __slots__ = ("code", "details")
+
     def __init__(
         self, message: str, code: int | None = None, details: str | None = None
     ) -> None:
@@ -29,9 +33,11 @@ class CustomException(Exception):
 
     def __str__(self) -> str:
         """Return a string representation of the exception."""
-        base_message = f"Error: {self.args[0]}"
+        if self.code is None and self.details is None:
+            return f"Error: {self.args[0]}"
+        parts = [f"Error: {self.args[0]}"]
         if self.code:
-            base_message += f" (Code: {self.code})"
+            parts.append(f" (Code: {self.code})")
         if self.details:
-            base_message += f" | Details: {self.details}"
-        return base_message
+            parts.append(f" | Details: {self.details}")
+        return "".join(parts)